@@ -8,6 +8,7 @@ Usage:
     uvicorn iris_voice_backend.main:app --host 0.0.0.0 --port 8001
 """
 
+import base64
 import io
 import logging
 import os
@@ -142,6 +143,25 @@ class SynthesizeRequest(BaseModel):
     speech_rate: float = Field(default=1.0, ge=0.5, le=2.0)
 
 
+class SynthesizeBatchRequest(BaseModel):
+    """Request for synthesizing several texts in one round trip."""
+
+    batch: list[SynthesizeRequest] = Field(min_length=1, max_length=16)
+
+
+class SynthesizedAudio(BaseModel):
+    """One synthesized item of a batch."""
+
+    audio_wav_base64: str
+    duration_seconds: float = Field(ge=0.0)
+
+
+class SynthesizeBatchResponse(BaseModel):
+    """Response from batch TTS synthesis, in request order."""
+
+    results: list[SynthesizedAudio]
+
+
 class HealthResponse(BaseModel):
     """Health check response."""
 
@@ -407,6 +427,38 @@ async def synthesize_speech(request: SynthesizeRequest):
         raise HTTPException(status_code=500, detail=f"Synthesis failed: {e}")
 
 
+@app.post("/synthesize_batch", response_model=SynthesizeBatchResponse)
+def synthesize_speech_batch(request: SynthesizeBatchRequest):
+    """
+    Synthesize several texts in one request using Kokoro.
+
+    Returns one base64-encoded WAV per input, in order. Items are synthesized
+    back to back on the loaded model; this saves an HTTP round trip per text.
+    A plain def, so FastAPI runs the blocking loop in its threadpool instead
+    of stalling the event loop (and /ws/voice) for the whole batch.
+    """
+    try:
+        tts = get_kokoro_tts(TTS_DEVICE)
+        results = []
+        for item in request.batch:
+            result = tts.synthesize(
+                text=item.text,
+                speed=item.speech_rate,
+            )
+            results.append(
+                SynthesizedAudio(
+                    audio_wav_base64=base64.b64encode(result.to_wav_bytes()).decode("ascii"),
+                    duration_seconds=result.duration_seconds,
+                )
+            )
+
+        return SynthesizeBatchResponse(results=results)
+
+    except Exception as e:
+        logger.exception("Batch synthesis failed")
+        raise HTTPException(status_code=500, detail=f"Synthesis failed: {e}")
+
+
 @app.post("/synthesize/stream")
 async def synthesize_speech_streaming(request: SynthesizeRequest):
     """
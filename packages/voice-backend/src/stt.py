@@ -55,6 +55,7 @@ class SpeechToText:
         model_size: ModelSize = "base",
         device: Literal["cpu", "cuda", "auto"] = "auto",
         compute_type: Literal["int8", "float16", "float32"] = "int8",
+        model: WhisperModel | None = None,
     ):
         """
         Initialize the STT model.
@@ -63,11 +64,12 @@ class SpeechToText:
             model_size: Whisper model size. "base" recommended for VPS (200MB RAM).
             device: Compute device. "auto" selects GPU if available.
             compute_type: Quantization level. "int8" for lowest memory.
+            model: Already-loaded WhisperModel to share instead of loading a new one.
         """
         self.model_size = model_size
         self.device = device
         self.compute_type = compute_type
-        self._model: WhisperModel | None = None
+        self._model: WhisperModel | None = model
 
     @property
     def model(self) -> WhisperModel:
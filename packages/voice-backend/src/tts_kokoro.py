@@ -58,16 +58,19 @@ class SynthesisResult:
     sample_rate: int
     duration_seconds: float
 
-    def to_wav_bytes(self) -> bytes:
-        """Convert to WAV file bytes."""
-        buffer = io.BytesIO()
+    def to_int16(self) -> np.ndarray:
+        """Convert to mono int16 PCM, clipping to [-1, 1] so overshoot can't wrap around."""
         # Ensure audio is 1D (mono)
         audio = self.audio.squeeze()
         if audio.ndim > 1:
             audio = audio[0] if audio.shape[0] < audio.shape[-1] else audio[:, 0]
-        # Convert to int16 for WAV
-        audio_int16 = (audio * 32767).astype(np.int16)
-        wavfile.write(buffer, self.sample_rate, audio_int16)
+        audio = np.clip(audio, -1.0, 1.0)
+        return (audio * 32767).astype(np.int16)
+
+    def to_wav_bytes(self) -> bytes:
+        """Convert to WAV file bytes."""
+        buffer = io.BytesIO()
+        wavfile.write(buffer, self.sample_rate, self.to_int16())
         return buffer.getvalue()
 
 
@@ -221,7 +224,7 @@ class KokoroTTS:
         result = self.synthesize(text, voice=voice)
 
         # Convert to int16 for streaming
-        audio_int16 = (result.audio * 32767).astype(np.int16)
+        audio_int16 = result.to_int16()
 
         # Yield chunks
         for i in range(0, len(audio_int16), chunk_size):
@@ -5,6 +5,7 @@ Outputs WAV files to ./voice_samples/
 """
 
 import os
+import struct
 from pathlib import Path
 
 # Create output directory
@@ -31,6 +32,17 @@ VOICES_TO_TEST = [
     ("am_puck", "C+"),
 ]
 
+
+def write_wav(path, rate, pcm_int16):
+    """Write mono 16-bit PCM as a WAV file (plain 44-byte header, no scipy import)."""
+    n = pcm_int16.nbytes
+    header = struct.pack("<4sI4s4sIHHIIHH4sI", b"RIFF", 36 + n, b"WAVE", b"fmt ", 16,
+                         1, 1, rate, rate * 2, 2, 16, b"data", n)
+    with open(path, "wb") as f:
+        f.write(header)
+        f.write(pcm_int16.tobytes())
+
+
 print("Loading Kokoro model (on CPU for sampling)...")
 from kokoro import KPipeline
 
@@ -57,9 +69,8 @@ for voice_id, grade in VOICES_TO_TEST:
 
             # Save as WAV
             output_path = output_dir / f"{grade}_{voice_id}.wav"
-            import scipy.io.wavfile as wavfile
             # Kokoro outputs at 24kHz
-            wavfile.write(str(output_path), 24000, (full_audio * 32767).astype(np.int16))
+            write_wav(output_path, 24000, (full_audio * 32767).astype(np.int16))
             print(f"saved to {output_path}")
         else:
             print("no audio generated")
@@ -14,25 +14,23 @@ Usage:
 """
 
 import argparse
-import os
 import sys
 import time
 import subprocess
-import tempfile
 
 # Setup paths
 sys.path.insert(0, 'src')
 
 import numpy as np
-import scipy.io.wavfile as wav
 
 
 def play_audio(audio_data, sample_rate=24000):
-    """Play audio using aplay."""
-    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-        wav.write(f.name, sample_rate, audio_data)
-        subprocess.run(["aplay", "-q", f.name], check=True)
-        os.unlink(f.name)
+    """Play int16 audio by piping raw PCM into aplay (no temp WAV file)."""
+    subprocess.run(
+        ["aplay", "-q", "-f", "S16_LE", "-r", str(sample_rate), "-c", "1"],
+        input=audio_data.tobytes(),
+        check=True,
+    )
 
 
 def main():
@@ -26,9 +26,7 @@ import re
 import uuid
 import requests
 import numpy as np
-import scipy.io.wavfile as wav
 import subprocess
-import tempfile
 import argparse
 from dataclasses import dataclass, asdict
 from datetime import datetime, timezone
@@ -212,11 +210,12 @@ Speak as if narrating or having a conversation."""
 
 
 def play_audio(audio_data, sample_rate=24000):
-    """Play audio using aplay."""
-    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-        wav.write(f.name, sample_rate, audio_data)
-        subprocess.run(["aplay", "-q", f.name], check=True)
-        os.unlink(f.name)
+    """Play int16 audio by piping raw PCM into aplay (no temp WAV file)."""
+    subprocess.run(
+        ["aplay", "-q", "-f", "S16_LE", "-r", str(sample_rate), "-c", "1"],
+        input=audio_data.tobytes(),
+        check=True,
+    )
 
 
 def stream_ollama(model: str, prompt: str, max_tokens: int = 500) -> Generator[str, None, dict]:
@@ -5,16 +5,27 @@ Benchmark: Streaming STT vs Batch STT
 Compares:
 - Batch mode (current): ~181ms
 - Streaming mode (target): <50ms
+- int8 vs float16 compute types (int8 decode is slower than fp16 at batch size 1 on GPU)
+- Batched inference (BatchedInferencePipeline) vs sequential decode
+- base vs distil-small.en vs large-v3-turbo checkpoints (streaming arm)
+- transformers pipeline with Flash Attention 2 / BetterTransformer (fp16)
 
 Usage:
     python test_streaming_stt.py
 """
 
+import math
 import os
 import sys
 import time
+from contextlib import contextmanager
+from functools import lru_cache
 import numpy as np
 
+# Checkpoints compared in the streaming arm, smallest first
+STREAMING_MODELS = ["base", "distil-small.en", "large-v3-turbo"]
+TARGET_LATENCY_MS = 50.0
+
 # Setup cuDNN before other imports
 def _setup_cudnn_path():
     try:
@@ -32,23 +43,53 @@ def _setup_cudnn_path():
 _setup_cudnn_path()
 
 
+@lru_cache(maxsize=4)
 def load_real_speech_audio(wav_path: str = "voice_samples/A_af_heart.wav") -> bytes:
-    """Load real speech audio and resample to 16kHz mono."""
+    """Load real speech audio and resample to 16kHz mono. Cached per path."""
     import scipy.io.wavfile as wav
     import scipy.signal as signal
 
-    sr, audio = wav.read(wav_path)
+    # mmap: samples are paged in from the file rather than read into an intermediate copy
+    sr, audio = wav.read(wav_path, mmap=True)
     print(f"Loaded: {wav_path} ({sr}Hz, {len(audio)/sr:.2f}s)")
 
-    # Resample to 16kHz if needed
+    # Resample to 16kHz if needed (polyphase FIR: no full-signal FFT, no complex buffer)
     if sr != 16000:
-        num_samples = int(len(audio) * 16000 / sr)
-        audio = signal.resample(audio, num_samples).astype(np.int16)
+        g = math.gcd(16000, sr)
+        audio = signal.resample_poly(audio.astype(np.float32, copy=False), 16000 // g, sr // g)
+        audio = audio.astype(np.int16)
         print(f"Resampled to 16kHz ({len(audio)/16000:.2f}s)")
 
     return audio.tobytes()
 
 
+# float32 benchmark audio, converted once and shared by every arm
+_benchmark_audio: np.ndarray | None = None
+
+
+def get_benchmark_audio() -> np.ndarray:
+    """
+    Return the real speech sample as float32 [-1, 1], converted once per process.
+
+    The buffer lives in page-locked (pinned) host memory when torch is available,
+    so host->device copies skip the staging buffer. Every warmup and timed run
+    sees the same array, so no per-run dtype conversion leaks into the numbers.
+    """
+    global _benchmark_audio
+    if _benchmark_audio is None:
+        samples = np.frombuffer(load_real_speech_audio(), dtype=np.int16)
+        try:
+            import torch
+            # .numpy() shares memory with the pinned tensor and keeps it alive
+            buffer = torch.empty(len(samples), dtype=torch.float32, pin_memory=True).numpy()
+        except (ImportError, RuntimeError):
+            buffer = np.empty(len(samples), dtype=np.float32)
+        # Single fused int16 -> float32 scale pass straight into the buffer (no temporaries)
+        np.multiply(samples, np.float32(1.0 / 32768.0), out=buffer, casting="unsafe")
+        _benchmark_audio = buffer
+    return _benchmark_audio
+
+
 def create_test_audio(text: str = "Hello, what is the status of my fleet?", duration_s: float = 2.0) -> bytes:
     """Create synthetic test audio (silence + beep pattern for testing)."""
     sample_rate = 16000
@@ -66,20 +107,59 @@ def create_test_audio(text: str = "Hello, what is the status of my fleet?", dura
     return audio_int16.tobytes()
 
 
-def benchmark_batch_stt():
-    """Benchmark current batch mode STT."""
+@contextmanager
+def cuda_timer():
+    """
+    Time a block with CUDA events (device time) and perf_counter (end-to-end wall time).
+
+    Yields a dict that holds "gpu_ms" and "wall_ms" once the block exits.
+    Without torch/CUDA, "gpu_ms" falls back to the wall time.
+    """
+    timing = {}
+    events = None
+    try:
+        import torch
+        if torch.cuda.is_available():
+            events = (torch.cuda.Event(enable_timing=True), torch.cuda.Event(enable_timing=True))
+    except ImportError:
+        pass
+
+    if events:
+        torch.cuda.synchronize()  # Keep earlier queued work (e.g. warmup) out of this measurement
+        events[0].record()
+    start = time.perf_counter()
+    yield timing
+    if events:
+        events[1].record()
+        torch.cuda.synchronize()
+    timing["wall_ms"] = (time.perf_counter() - start) * 1000
+    timing["gpu_ms"] = events[0].elapsed_time(events[1]) if events else timing["wall_ms"]
+
+
+def collect_text(segments) -> str:
+    """
+    Drain a faster-whisper segment generator and join the segment text.
+
+    faster-whisper defers decoding until the generator is iterated, so this
+    must run inside the timed interval. A list comprehension lets str.join
+    size the result up front instead of consuming a generator.
+    """
+    return " ".join([seg.text for seg in segments])
+
+
+def benchmark_batch_stt(compute_type: str = "float16", model=None):
+    """Benchmark current batch mode STT. Pass `model` to reuse a loaded WhisperModel."""
     from src.stt import SpeechToText
 
     print("\n" + "=" * 60)
-    print("BATCH MODE STT (current)")
+    print(f"BATCH MODE STT (current, {compute_type})")
     print("=" * 60)
 
-    stt = SpeechToText(model_size="base", device="cuda", compute_type="int8")
+    stt = SpeechToText(model_size="base", device="cuda", compute_type=compute_type, model=model)
 
     # Load real speech audio
     print("Loading real speech audio...")
-    audio_bytes = load_real_speech_audio()
-    audio_np = np.frombuffer(audio_bytes, dtype=np.int16).astype(np.float32) / 32768.0
+    audio_np = get_benchmark_audio()
 
     # Warmup
     print("Warming up...")
@@ -89,33 +169,32 @@ def benchmark_batch_stt():
     # Benchmark
     times = []
     for i in range(5):
-        start = time.perf_counter()
-        result = stt.transcribe(audio_np)
-        elapsed = time.perf_counter() - start
-        times.append(elapsed * 1000)
+        with cuda_timer() as timing:
+            result = stt.transcribe(audio_np)
+        times.append(timing["gpu_ms"])
         text = result.text[:50] if result.text else "(no speech)"
-        print(f"  Run {i+1}: {elapsed*1000:.1f}ms - '{text}...'")
+        print(f"  Run {i+1}: {timing['gpu_ms']:.1f}ms GPU / {timing['wall_ms']:.1f}ms wall - '{text}...'")
 
     print(f"\nBatch mode average: {np.mean(times):.1f}ms")
     return np.mean(times)
 
 
-def benchmark_streaming_stt():
-    """Benchmark new streaming mode STT using direct faster-whisper streaming."""
+def benchmark_streaming_stt(compute_type: str = "float16", model_name: str = "base", model=None):
+    """Benchmark new streaming mode STT using direct faster-whisper streaming. Pass `model` to reuse one."""
     from faster_whisper import WhisperModel
 
     print("\n" + "=" * 60)
-    print("STREAMING MODE STT (direct faster-whisper)")
+    print(f"STREAMING MODE STT (direct faster-whisper, {model_name}, {compute_type})")
     print("=" * 60)
 
     # Load real speech audio
     print("Loading real speech audio...")
-    audio_bytes = load_real_speech_audio()
-    audio_np = np.frombuffer(audio_bytes, dtype=np.int16).astype(np.float32) / 32768.0
+    audio_np = get_benchmark_audio()
 
     # Create model directly (bypass RealtimeSTT's complexity)
-    print("Loading model...")
-    model = WhisperModel("base", device="cuda", compute_type="int8")
+    if model is None:
+        print("Loading model...")
+        model = WhisperModel(model_name, device="cuda", compute_type=compute_type, num_workers=1)
 
     # Warmup
     print("Warming up...")
@@ -126,79 +205,163 @@ def benchmark_streaming_stt():
     # This measures the raw transcription speed without VAD overhead
     times = []
     for i in range(5):
-        start = time.perf_counter()
-        segments, info = model.transcribe(audio_np, beam_size=1)
-        result = " ".join(seg.text for seg in segments)
-        elapsed = time.perf_counter() - start
-        times.append(elapsed * 1000)
+        with cuda_timer() as timing:
+            segments, info = model.transcribe(audio_np, beam_size=1)
+            result = collect_text(segments)
+        times.append(timing["gpu_ms"])
         text = result[:50] if result else "(no speech)"
-        print(f"  Run {i+1}: {elapsed*1000:.1f}ms - '{text}...'")
+        print(f"  Run {i+1}: {timing['gpu_ms']:.1f}ms GPU / {timing['wall_ms']:.1f}ms wall - '{text}...'")
 
     print(f"\nDirect faster-whisper average: {np.mean(times):.1f}ms")
     return np.mean(times)
 
 
-def benchmark_streaming_stt_with_vad():
-    """Benchmark streaming mode with VAD (RealtimeSTT)."""
-    from RealtimeSTT import AudioToTextRecorder
+def benchmark_batched_stt(compute_type: str = "float16", batch_size: int = 8, model=None):
+    """Benchmark faster-whisper's BatchedInferencePipeline (batched decode). Pass `model` to reuse one."""
+    from faster_whisper import BatchedInferencePipeline, WhisperModel
+
+    print("\n" + "=" * 60)
+    print(f"BATCHED INFERENCE STT (batch_size={batch_size}, {compute_type}, no VAD)")
+    print("=" * 60)
+
+    # Load real speech audio
+    print("Loading real speech audio...")
+    audio_np = get_benchmark_audio()
+
+    if model is None:
+        print("Loading model...")
+        model = WhisperModel("base", device="cuda", compute_type=compute_type)
+    pipeline = BatchedInferencePipeline(model=model)
+
+    # BatchedInferencePipeline defaults to vad_filter=True; the clip is under 30s,
+    # so without VAD it is one window and this arm measures batched decode alone
+    print("Warming up...")
+    segments, _ = pipeline.transcribe(audio_np, vad_filter=False, batch_size=batch_size, beam_size=1)
+    _ = list(segments)  # Force evaluation
+
+    times = []
+    for i in range(5):
+        with cuda_timer() as timing:
+            segments, info = pipeline.transcribe(audio_np, vad_filter=False, batch_size=batch_size, beam_size=1)
+            result = collect_text(segments)
+        times.append(timing["gpu_ms"])
+        text = result[:50] if result else "(no speech)"
+        print(f"  Run {i+1}: {timing['gpu_ms']:.1f}ms GPU / {timing['wall_ms']:.1f}ms wall - '{text}...'")
+
+    print(f"\nBatched pipeline average: {np.mean(times):.1f}ms")
+    return np.mean(times)
+
+
+def benchmark_transformers_fa2(model_id: str = "openai/whisper-base"):
+    """Benchmark Whisper via transformers pipeline (Flash Attention 2 / BetterTransformer, fp16).
+
+    Returns None (arm skipped) if torch or transformers is not installed.
+    """
+    try:
+        import torch
+        from transformers import AutoModelForSpeechSeq2Seq, AutoProcessor, pipeline
+    except ImportError as e:  # transformers is optional; not a voice-backend dependency
+        print(f"\nSkipping transformers pipeline benchmark ({e})")
+        return None
 
     print("\n" + "=" * 60)
-    print("STREAMING MODE STT (with VAD - RealtimeSTT)")
+    print(f"TRANSFORMERS PIPELINE STT ({model_id}, float16)")
     print("=" * 60)
 
     # Load real speech audio
     print("Loading real speech audio...")
-    audio_bytes = load_real_speech_audio()
-    audio_np = np.frombuffer(audio_bytes, dtype=np.int16)
-    chunk_size = 640  # 20ms at 16kHz, 16-bit mono
-
-    # Create recorder with minimal config
-    print("Creating recorder...")
-    result_text = []
-
-    def on_text(text):
-        result_text.append(text)
-
-    recorder = AudioToTextRecorder(
-        model="base",
-        device="cuda",
-        compute_type="int8",
-        use_microphone=False,
-        spinner=False,
-        silero_sensitivity=0.4,
-        webrtc_sensitivity=2,
-        post_speech_silence_duration=0.3,
-        min_length_of_recording=0.2,
-        beam_size=1,
-        print_transcription_time=False,
+    audio_np = get_benchmark_audio()
+
+    # Flash Attention 2 needs Ampere (sm_80) or newer; fall back to BetterTransformer below that
+    print("Loading model...")
+    major, _ = torch.cuda.get_device_capability()
+    attn_impl = None
+    model = None
+    if major >= 8:
+        try:
+            model = AutoModelForSpeechSeq2Seq.from_pretrained(
+                model_id, torch_dtype=torch.float16, attn_implementation="flash_attention_2"
+            )
+            attn_impl = "flash_attention_2"
+        except (ImportError, ValueError) as e:
+            print(f"  Flash Attention 2 unavailable ({e}), using BetterTransformer")
+
+    if model is None:
+        model = AutoModelForSpeechSeq2Seq.from_pretrained(model_id, torch_dtype=torch.float16)
+        try:
+            model = model.to_bettertransformer()
+            attn_impl = "bettertransformer"
+        except (ImportError, ValueError) as e:
+            print(f"  BetterTransformer unavailable ({e}), using default attention")
+            attn_impl = "default"
+
+    processor = AutoProcessor.from_pretrained(model_id)
+    pipe = pipeline(
+        "automatic-speech-recognition",
+        model=model,
+        tokenizer=processor.tokenizer,
+        feature_extractor=processor.feature_extractor,
+        torch_dtype=torch.float16,
+        device="cuda:0",
+        chunk_length_s=30,
+        batch_size=24,
     )
+    print(f"Attention implementation: {attn_impl}")
 
     # Warmup
     print("Warming up...")
+    _ = pipe(audio_np)
 
-    # Benchmark
     times = []
-    for i in range(3):  # Fewer runs due to complexity
-        result_text.clear()
-
-        # Feed audio chunks rapidly (faster than real-time)
-        feed_start = time.perf_counter()
-        for j in range(0, len(audio_np), chunk_size // 2):  # int16 = 2 bytes
-            chunk = audio_np[j:j + chunk_size // 2]
-            recorder.feed_audio(chunk)
-        feed_time = time.perf_counter() - feed_start
-
-        # Get transcript
-        start = time.perf_counter()
-        result = recorder.text()
-        elapsed = time.perf_counter() - start
-        times.append(elapsed * 1000)
+    for i in range(5):
+        with cuda_timer() as timing:
+            result = pipe(audio_np)["text"]
+        times.append(timing["gpu_ms"])
+        text = result[:50] if result else "(no speech)"
+        print(f"  Run {i+1}: {timing['gpu_ms']:.1f}ms GPU / {timing['wall_ms']:.1f}ms wall - '{text}...'")
+
+    print(f"\nTransformers pipeline average: {np.mean(times):.1f}ms")
+    return np.mean(times)
+
+
+def benchmark_streaming_stt_with_vad(compute_type: str = "float16", batch_size: int = 8, model=None):
+    """Benchmark streaming mode with VAD (Silero VAD + BatchedInferencePipeline). Pass `model` to reuse one."""
+    from faster_whisper import BatchedInferencePipeline, WhisperModel
 
+    print("\n" + "=" * 60)
+    print(f"STREAMING MODE STT (with VAD - BatchedInferencePipeline, {compute_type})")
+    print("=" * 60)
+
+    # Load real speech audio
+    print("Loading real speech audio...")
+    audio_np = get_benchmark_audio()
+
+    # Built-in Silero VAD replaces RealtimeSTT's 20ms Python-side feeder loop
+    if model is None:
+        print("Loading model...")
+        model = WhisperModel("base", device="cuda", compute_type=compute_type)
+    pipeline = BatchedInferencePipeline(model=model)
+    vad_parameters = dict(min_silence_duration_ms=300)
+
+    # Warmup
+    print("Warming up...")
+    segments, _ = pipeline.transcribe(
+        audio_np, vad_filter=True, vad_parameters=vad_parameters, batch_size=batch_size, beam_size=1
+    )
+    _ = list(segments)  # Force evaluation
+
+    times = []
+    for i in range(5):
+        with cuda_timer() as timing:
+            segments, info = pipeline.transcribe(
+                audio_np, vad_filter=True, vad_parameters=vad_parameters, batch_size=batch_size, beam_size=1
+            )
+            result = collect_text(segments)
+        times.append(timing["gpu_ms"])
         text = result[:50] if result else "(no speech)"
-        print(f"  Run {i+1}: feed={feed_time*1000:.0f}ms, transcribe={elapsed*1000:.1f}ms - '{text}...'")
+        print(f"  Run {i+1}: {timing['gpu_ms']:.1f}ms GPU / {timing['wall_ms']:.1f}ms wall - '{text}...'")
 
-    print(f"\nRealtimeSTT average (transcribe time): {np.mean(times):.1f}ms")
-    recorder.shutdown()
+    print(f"\nVAD + batched pipeline average: {np.mean(times):.1f}ms")
     return np.mean(times)
 
 
@@ -211,19 +374,52 @@ def main():
     print("\nUsing REAL SPEECH audio from voice_samples/")
     print("Audio: ~6s sample resampled to 16kHz mono")
 
-    batch_time = benchmark_batch_stt()
-    streaming_time = benchmark_streaming_stt()
+    # Load base/float16 once and share it across every arm that uses it:
+    # model load is multi-second and a second copy would contend for VRAM
+    from faster_whisper import WhisperModel
+    print("\nLoading shared base model (float16)...")
+    base_model = WhisperModel("base", device="cuda", compute_type="float16")
+
+    batch_time = benchmark_batch_stt(model=base_model)
+    streaming_times = {
+        "int8": benchmark_streaming_stt("int8"),
+        "float16": benchmark_streaming_stt("float16", model=base_model),
+    }
+    batched_time = benchmark_batched_stt(model=base_model)
+    transformers_time = benchmark_transformers_fa2()
+    vad_time = benchmark_streaming_stt_with_vad(model=base_model)
+    model_times = {"base": streaming_times["float16"]}
+    for model_name in STREAMING_MODELS[1:]:
+        model_times[model_name] = benchmark_streaming_stt("float16", model_name)
+
+    streaming_time = min(streaming_times.values())
+    fastest_type = min(streaming_times, key=streaming_times.get)
+    # STREAMING_MODELS is ordered smallest first, so the first hit is the smallest model meeting the SLA
+    sla_model = next((m for m in STREAMING_MODELS if model_times[m] < TARGET_LATENCY_MS), None)
 
     print("\n" + "=" * 60)
     print("SUMMARY")
     print("=" * 60)
     print(f"Batch STT (our wrapper):        {batch_time:.1f}ms")
-    print(f"Direct faster-whisper:          {streaming_time:.1f}ms")
+    for compute_type, elapsed in streaming_times.items():
+        label = f"Direct faster-whisper ({compute_type}):"
+        print(f"{label:<32}{elapsed:.1f}ms")
+    print(f"Batched, no VAD (float16):      {batched_time:.1f}ms")
+    if transformers_time is not None:
+        print(f"Transformers FA2 (float16):     {transformers_time:.1f}ms")
+    else:
+        print("Transformers FA2 (float16):     skipped (transformers not installed)")
+    print(f"VAD + batched (float16):        {vad_time:.1f}ms")
+    print(f"Fastest compute type:           {fastest_type}")
+    for model_name, elapsed in model_times.items():
+        label = f"Model {model_name} (float16):"
+        print(f"{label:<32}{elapsed:.1f}ms")
+    print(f"Smallest model under target:    {sla_model or '(none)'}")
     print(f"Improvement:                    {((batch_time - streaming_time) / batch_time * 100):.1f}%")
-    print(f"Target:                         <50ms")
+    print(f"Target:                         <{TARGET_LATENCY_MS:.0f}ms")
     print()
-    print("Note: RealtimeSTT VAD benchmark skipped (requires async handling)")
-    print("      The direct faster-whisper test shows raw transcription speed.")
+    print("Note: The direct faster-whisper test shows raw transcription speed;")
+    print("      the VAD arm adds Silero speech detection in front of batched decode.")
 
 
 if __name__ == "__main__":
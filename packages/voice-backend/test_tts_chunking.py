@@ -36,22 +36,43 @@ Usage:
 """
 
 import argparse
+import asyncio
 import time
-import requests
+import hashlib
+import httpx
 import json
+import os
 import sys
 import re
+import uuid
+from collections import OrderedDict
+from functools import lru_cache
 from dataclasses import dataclass, field
 from typing import List, Literal, Optional
 
 # Configuration
-AGENT_API_URL = "http://localhost:3001"
-VOICE_BACKEND_URL = "http://localhost:8001"
+AGENT_API_URL = os.getenv("AGENT_API_URL", "http://localhost:3001")
+VOICE_BACKEND_URL = os.getenv("VOICE_BACKEND_URL", "http://localhost:8001")
 
 # Chunking settings (should match text-chunker.ts)
 MIN_CHUNK_SIZE = 10
 MAX_CHUNK_SIZE = 500
 
+# agent-core's api-server writes each SSE frame as JSON.stringify({type, content, ...}),
+# so text frames can be recognised by prefix before paying for json.loads
+SSE_TEXT_PREFIX = 'data: {"type":"text"'
+
+# One pooled client is shared by every agent stream and TTS request in flight
+CLIENT_LIMITS = httpx.Limits(max_connections=16, max_keepalive_connections=16)
+
+# HTTP/2 is only negotiated (via ALPN) for https:// URLs, e.g. services behind a TLS
+# proxy; the local plain-http servers stay on the pooled HTTP/1.1 connections above.
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 # Test prompts that generate multi-sentence/paragraph responses
 TEST_PROMPTS = [
     "Tell me about Star Atlas and what makes it unique in the gaming space.",
@@ -67,6 +88,7 @@ class ChunkResult:
     mode: str
     detection_time_ms: float
     tts_time_ms: Optional[float] = None
+    tts_first_byte_ms: Optional[float] = None
     char_count: int = 0
 
 
@@ -87,65 +109,141 @@ class TextChunker:
     """Python version of text-chunker.ts for testing."""
 
     # Common abbreviations that shouldn't trigger sentence breaks
-    ABBREVIATIONS = {
+    ABBREVIATIONS = frozenset({
         "mr", "mrs", "ms", "dr", "prof", "sr", "jr", "vs", "etc",
         "inc", "ltd", "co", "corp", "dept", "est", "approx", "govt",
         "vol", "no", "fig", "e.g", "i.e", "viz", "cf", "al"
-    }
+    })
+    _MAX_ABBREV_LEN = max(len(a) for a in ABBREVIATIONS)
+
+    # Compiled once: add() runs per streamed token, on the time-to-first-audio path
+    _SENT_RE = re.compile(r'[.!?][\s\n]')
+    _WHITESPACE_RE = re.compile(r'^\s{2,}')
+    _NON_SPACE_RE = re.compile(r'\S')
 
     def __init__(self, mode: str = "sentence", min_size: int = MIN_CHUNK_SIZE, max_size: int = MAX_CHUNK_SIZE):
         self.mode = mode
         self.min_size = min_size
         self.max_size = max_size
         self.buffer = ""
+        # Tokens added since the buffer was last scanned. They are only joined onto the
+        # buffer when they could complete a chunk, so most add() calls are O(token)
+        # instead of copying and rescanning the whole buffer.
+        self._parts: List[str] = []
+        self._pending_len = 0
+        self._tail = ""  # Last character added, for boundaries split across tokens
+        self._scan_pos = 0  # Sentence ends before this offset were already rejected
+        self._settled = True  # Last scan left nothing extractable in the buffer
 
     def add(self, text: str) -> List[str]:
         """Add text and return any complete chunks."""
-        self.buffer += text
+        prev_tail = self._tail
+        self._tail = text[-1:] or prev_tail
+        self._parts.append(text)
+        self._pending_len += len(text)
+
+        if (
+            self._settled
+            and len(self.buffer) + self._pending_len <= self.max_size
+            and not self._may_complete(prev_tail + text)
+        ):
+            return []
+
+        self._materialize()
         return self._extract_chunks()
 
     def flush(self) -> Optional[str]:
         """Flush remaining text."""
+        self._materialize()
         remaining = self.buffer.strip()
         self.buffer = ""
+        self._tail = ""
+        self._scan_pos = 0
+        self._settled = True
         return remaining if len(remaining) >= self.min_size else None
 
+    def _may_complete(self, text: str) -> bool:
+        """Whether new text (with the previous last character) could end a chunk."""
+        if self.mode == "sentence":
+            return self._SENT_RE.search(text) is not None
+        return "\n" in text or "\n" in self.buffer
+
+    def _materialize(self):
+        """Join pending tokens onto the buffer."""
+        if not self._parts:
+            return
+        # Only the last old character can pair with new text to form a sentence end
+        self._scan_pos = max(0, len(self.buffer) - 1) if self._settled else 0
+        self.buffer += "".join(self._parts)
+        self._parts.clear()
+        self._pending_len = 0
+
     def _extract_chunks(self) -> List[str]:
-        chunks = []
-        while True:
-            chunk = self._extract_sentence() if self.mode == "sentence" else self._extract_paragraph()
-            if not chunk:
-                break
-            if len(chunk) >= self.min_size:
-                chunks.append(chunk)
-            else:
-                # Put it back if too small
-                self.buffer = chunk + self.buffer
-                break
+        if self.mode == "sentence":
+            chunks, settled = self._extract_sentences()
+        else:
+            chunks = []
+            settled = True
+            while True:
+                chunk = self._extract_paragraph()
+                if not chunk:
+                    # None: nothing left to find. "": buffer changed, rescan on next add
+                    settled = chunk is None
+                    break
+                if len(chunk) >= self.min_size:
+                    chunks.append(chunk)
+                else:
+                    # Put it back if too small
+                    self.buffer = chunk + self.buffer
+                    self._scan_pos = 0
+                    settled = False
+                    break
 
         # Force yield if buffer exceeds max size
         if len(self.buffer) > self.max_size:
             forced = self._force_extract()
+            self._scan_pos = 0
+            settled = False
             if forced:
                 chunks.append(forced)
 
+        self._settled = settled
+        self._tail = self.buffer[-1:]  # Extraction may have trimmed the buffer end
         return chunks
 
-    def _extract_sentence(self) -> Optional[str]:
-        """Extract a complete sentence."""
+    def _extract_sentences(self) -> tuple[List[str], bool]:
+        """Extract all complete sentences in one pass over the buffer.
+
+        Returns (chunks, settled). The buffer is trimmed once at the end rather than
+        re-sliced after every sentence.
+        """
+        buffer = self.buffer
+        chunks = []
+        start = 0  # Start of the not-yet-extracted text
+
         # Look for sentence-ending punctuation followed by space or newline
-        for match in re.finditer(r'[.!?][\s\n]', self.buffer):
+        for match in self._SENT_RE.finditer(buffer, self._scan_pos):
             end_pos = match.start() + 1
-            potential = self.buffer[:end_pos]
 
-            # Check for abbreviations
-            if self._is_abbreviation(potential):
+            # Check for abbreviations (only a period can follow one)
+            if buffer[end_pos - 1] == '.' and self._is_abbreviation(buffer, start, end_pos):
                 continue
 
-            self.buffer = self.buffer[end_pos:].lstrip()
-            return potential.strip()
+            chunk = buffer[start:end_pos].strip()
+            next_text = self._NON_SPACE_RE.search(buffer, end_pos)
+            start = next_text.start() if next_text else len(buffer)
 
-        return None
+            if len(chunk) < self.min_size:
+                # Put it back if too small
+                self.buffer = chunk + buffer[start:]
+                self._scan_pos = 0
+                return chunks, False
+            chunks.append(chunk)
+
+        if start:
+            self.buffer = buffer[start:]
+            self._scan_pos = 0
+        return chunks, True
 
     def _extract_paragraph(self) -> Optional[str]:
         """Extract a complete paragraph."""
@@ -160,7 +258,7 @@ class TextChunker:
         idx = self.buffer.find("\n")
         if idx != -1:
             after = self.buffer[idx + 1:]
-            if after.startswith("\n") or re.match(r'^\s{2,}', after):
+            if after.startswith("\n") or self._WHITESPACE_RE.match(after):
                 paragraph = self.buffer[:idx]
                 self.buffer = after.lstrip()
                 return paragraph.strip()
@@ -190,16 +288,28 @@ class TextChunker:
         self.buffer = self.buffer[self.max_size:]
         return chunk.strip()
 
-    def _is_abbreviation(self, text: str) -> bool:
-        """Check if text ends with an abbreviation."""
-        words = text.strip().split()
-        if not words:
+    def _is_abbreviation(self, buffer: str, start: int, end: int) -> bool:
+        """Check if buffer[start:end] ends with an abbreviation.
+
+        Only the last word is examined, without splitting or copying the whole text.
+        """
+        # Skip the trailing punctuation, then look back at most one abbreviation length
+        while end > start and buffer[end - 1] in '.!?':
+            end -= 1
+        if end == start or buffer[end - 1].isspace():
+            return False
+        lo = max(start, end - self._MAX_ABBREV_LEN - 1)
+        window = buffer[lo:end]
+        last_word = window.rsplit(None, 1)[-1]
+        # No whitespace in the window: the word started earlier and is too long to match
+        if len(last_word) == len(window) and lo > start:
             return False
-        last_word = re.sub(r'[.!?]+$', '', words[-1].lower())
-        return last_word in self.ABBREVIATIONS
+        return last_word.lower() in self.ABBREVIATIONS
 
 
-def stream_agent_response(prompt: str, user_id: str = "benchmark-user") -> tuple[str, float, List[tuple[str, float]]]:
+async def stream_agent_response(
+    client: httpx.AsyncClient, prompt: str, user_id: str = "benchmark-user"
+) -> tuple[str, float, List[tuple[str, float]]]:
     """
     Stream a response from the agent API.
     Returns: (full_response, total_time_ms, [(chunk_text, chunk_time_ms), ...])
@@ -212,84 +322,192 @@ def stream_agent_response(prompt: str, user_id: str = "benchmark-user") -> tuple
     }
 
     chunks_with_times = []
-    full_response = ""
-    start_time = time.time()
+    response_parts = []
+    start_ns = time.perf_counter_ns()
 
     try:
-        with requests.post(url, json=payload, stream=True, timeout=60) as response:
+        async with client.stream("POST", url, json=payload, timeout=60) as response:
             response.raise_for_status()
 
-            for line in response.iter_lines():
-                if not line:
-                    continue
-
-                line_str = line.decode('utf-8')
-                if not line_str.startswith('data: '):
+            async for line_str in response.aiter_lines():
+                # Skips blank, "event:" and non-text data lines without parsing them
+                if not line_str.startswith(SSE_TEXT_PREFIX):
                     continue
 
+                chunk_time = (time.perf_counter_ns() - start_ns) / 1e6
                 try:
-                    data = json.loads(line_str[6:])
-                    if data.get('type') == 'text':
-                        chunk_text = data.get('content', '')
-                        chunk_time = (time.time() - start_time) * 1000
-                        chunks_with_times.append((chunk_text, chunk_time))
-                        full_response += chunk_text
+                    chunk_text = json.loads(line_str[6:]).get('content', '')
                 except json.JSONDecodeError:
                     continue
+                chunks_with_times.append((chunk_text, chunk_time))
+                response_parts.append(chunk_text)
 
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         print(f"Error streaming from agent: {e}")
         return "", 0, []
 
-    total_time = (time.time() - start_time) * 1000
-    return full_response, total_time, chunks_with_times
+    total_time = (time.perf_counter_ns() - start_ns) / 1e6
+    return "".join(response_parts), total_time, chunks_with_times
 
 
-def synthesize_tts(text: str) -> float:
+# BENCHMARK-ONLY memo of measured TTS times, keyed on the request parameters.
+# compare_modes synthesizes the same prompt twice (sentence and paragraph), and
+# identical chunks reuse the first measurement instead of re-synthesizing. Cached
+# numbers are repeated measurements, not new ones: disable with --no-tts-cache when
+# checking for TTS regressions.
+TTS_CACHE_SIZE = 256
+_tts_cache: "OrderedDict[str, tuple[float, float]]" = OrderedDict()
+tts_cache_enabled = True
+
+# Chunks per /synthesize_batch request (1 = one /synthesize request per chunk).
+# Batching saves round trips, but a chunk's audio only arrives with its whole batch.
+tts_batch_size = 1
+TTS_BATCH_MAX = 16  # SynthesizeBatchRequest.batch max_length in src/main.py
+_batch_endpoint_available = True
+
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+@lru_cache(maxsize=8)
+def _tts_body_prefix(exaggeration: float, speech_rate: float) -> bytes:
+    """Serialized TTS request fields that don't depend on the text, ending before its value."""
+    return (json.dumps({"exaggeration": exaggeration, "speechRate": speech_rate})[:-1] + ', "text": ').encode()
+
+
+def _tts_body(text: str, exaggeration: float, speech_rate: float) -> bytes:
+    """JSON body for one TTS request; only the text is encoded per call."""
+    return _tts_body_prefix(exaggeration, speech_rate) + json.dumps(text).encode() + b"}"
+
+
+def _tts_cache_key(text: str, exaggeration: float, speech_rate: float) -> str:
+    return hashlib.blake2b(f"{text}|{exaggeration}|{speech_rate}".encode(), digest_size=16).hexdigest()
+
+
+def _tts_cache_get(key: str) -> Optional[tuple[float, float]]:
+    if tts_cache_enabled and key in _tts_cache:
+        _tts_cache.move_to_end(key)
+        return _tts_cache[key]
+    return None
+
+
+def _tts_cache_put(key: str, times: tuple[float, float]):
+    if tts_cache_enabled:
+        _tts_cache[key] = times
+        if len(_tts_cache) > TTS_CACHE_SIZE:
+            _tts_cache.popitem(last=False)
+
+
+async def synthesize_tts(
+    client: httpx.AsyncClient, text: str, exaggeration: float = 0.5, speech_rate: float = 1.0
+) -> tuple[float, float]:
     """
-    Synthesize text with Chatterbox and return time in ms.
+    Synthesize text as raw PCM and return (first_byte_ms, total_ms).
+
+    Uses /synthesize/stream so there is no WAV header to build or parse, and the
+    time to the first audio byte is measured separately from the full download.
+    Repeated (text, exaggeration, speech_rate) requests return the cached times (see _tts_cache).
     """
-    url = f"{VOICE_BACKEND_URL}/synthesize"
-    payload = {
-        "text": text,
-        "exaggeration": 0.5,
-        "speechRate": 1.0
-    }
+    key = _tts_cache_key(text, exaggeration, speech_rate)
+    cached = _tts_cache_get(key)
+    if cached is not None:
+        return cached
 
-    start_time = time.time()
+    url = f"{VOICE_BACKEND_URL}/synthesize/stream"
+    body = _tts_body(text, exaggeration, speech_rate)
+
+    start_ns = time.perf_counter_ns()
+    first_byte_ns = None
+    try:
+        async with client.stream("POST", url, content=body, headers=_JSON_HEADERS, timeout=30) as response:
+            response.raise_for_status()
+            async for chunk in response.aiter_raw():
+                if first_byte_ns is None and chunk:
+                    first_byte_ns = time.perf_counter_ns()
+    except httpx.HTTPError as e:
+        print(f"TTS error: {e}")
+        return -1, -1
+
+    end_ns = time.perf_counter_ns()
+    times = ((first_byte_ns or end_ns) - start_ns) / 1e6, (end_ns - start_ns) / 1e6
+    _tts_cache_put(key, times)
+    return times
+
+
+async def synthesize_tts_batch(
+    client: httpx.AsyncClient, texts: List[str], exaggeration: float = 0.5, speech_rate: float = 1.0
+) -> List[tuple[float, float]]:
+    """
+    Synthesize several texts in one /synthesize_batch request and return (first_byte_ms, total_ms) per text.
+
+    Every text's audio arrives with the response, so both times are the full round trip.
+    Falls back to concurrent per-text requests if the backend has no batch endpoint.
+    """
+    global _batch_endpoint_available
+    if not _batch_endpoint_available:
+        return list(await asyncio.gather(
+            *(synthesize_tts(client, text, exaggeration, speech_rate) for text in texts)
+        ))
+
+    keys = [_tts_cache_key(text, exaggeration, speech_rate) for text in texts]
+    times = [_tts_cache_get(key) for key in keys]
+    missing = [i for i, t in enumerate(times) if t is None]
+    if not missing:
+        return times
+
+    url = f"{VOICE_BACKEND_URL}/synthesize_batch"
+    body = b'{"batch": [' + b", ".join(_tts_body(texts[i], exaggeration, speech_rate) for i in missing) + b"]}"
+
+    start_ns = time.perf_counter_ns()
     try:
-        response = requests.post(url, json=payload, timeout=30)
+        response = await client.post(url, content=body, headers=_JSON_HEADERS, timeout=60)
+        if response.status_code == 404:
+            if _batch_endpoint_available:
+                print("  /synthesize_batch not available, falling back to per-chunk requests")
+                _batch_endpoint_available = False
+            return await synthesize_tts_batch(client, texts, exaggeration, speech_rate)
         response.raise_for_status()
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         print(f"TTS error: {e}")
-        return -1
+        return [(-1, -1) if t is None else t for t in times]
 
-    return (time.time() - start_time) * 1000
+    elapsed_ms = (time.perf_counter_ns() - start_ns) / 1e6
+    for i in missing:
+        times[i] = (elapsed_ms, elapsed_ms)
+        _tts_cache_put(keys[i], times[i])
+    return times
 
 
-def run_chunking_benchmark(
+async def run_chunking_benchmark(
+    client: httpx.AsyncClient,
     prompt: str,
     mode: str,
     run_tts: bool = True
 ) -> ChunkingBenchmark:
     """
     Run a full chunking benchmark for a prompt.
+
+    Each run gets its own agent user ID so concurrent runs don't share a conversation.
     """
     result = ChunkingBenchmark(prompt=prompt, mode=mode)
 
     # Stream the response
-    print(f"  Streaming response...")
-    full_response, total_time, raw_chunks = stream_agent_response(prompt)
+    print(f"  [{mode}] Streaming response...")
+    user_id = f"benchmark-{mode}-{uuid.uuid4().hex[:8]}"
+    full_response, total_time, raw_chunks = await stream_agent_response(client, prompt, user_id)
     result.total_response_chars = len(full_response)
     result.total_response_time_ms = total_time
 
     if not full_response:
-        print(f"  No response received!")
+        print(f"  [{mode}] No response received!")
         return result
 
-    # Process chunks through the chunker
+    # Process chunks through the chunker, grouping them into TTS requests
+    # (one chunk each, or tts_batch_size per /synthesize_batch call)
     chunker = TextChunker(mode=mode)
     first_chunk_time = None
+    tts_groups: List[List[ChunkResult]] = []  # in chunk order
+    batch: List[ChunkResult] = []
 
     for chunk_text, chunk_time in raw_chunks:
         completed = chunker.add(chunk_text)
@@ -306,9 +524,10 @@ def run_chunking_benchmark(
 
             # Run TTS if enabled
             if run_tts:
-                tts_time = synthesize_tts(completed_chunk)
-                chunk_result.tts_time_ms = tts_time
-                result.total_tts_time_ms += max(0, tts_time)
+                batch.append(chunk_result)
+                if len(batch) >= tts_batch_size:
+                    tts_groups.append(batch)
+                    batch = []
 
             result.chunks.append(chunk_result)
 
@@ -323,17 +542,41 @@ def run_chunking_benchmark(
         )
 
         if run_tts:
-            tts_time = synthesize_tts(remaining)
-            chunk_result.tts_time_ms = tts_time
-            result.total_tts_time_ms += max(0, tts_time)
+            batch.append(chunk_result)
 
         result.chunks.append(chunk_result)
 
+    if batch:
+        tts_groups.append(batch)
+
+    async def synthesize_group(group: List[ChunkResult]) -> List[tuple[float, float]]:
+        if tts_batch_size > 1:
+            return await synthesize_tts_batch(client, [c.text for c in group])
+        return [await synthesize_tts(client, group[0].text)]
+
+    if tts_groups:
+        # The first request runs alone: when it goes out in real streaming nothing
+        # else has been detected yet, so its first byte must not queue behind later
+        # chunks. The rest then run concurrently.
+        group_times = [await synthesize_group(tts_groups[0])]
+        group_times += await asyncio.gather(*(synthesize_group(group) for group in tts_groups[1:]))
+        for group, tts_times in zip(tts_groups, group_times):
+            for chunk_result, (first_byte, tts_time) in zip(group, tts_times):
+                chunk_result.tts_first_byte_ms = first_byte
+                chunk_result.tts_time_ms = tts_time
+                result.total_tts_time_ms += max(0, tts_time)
+
     # Calculate timing metrics
     if result.chunks:
         result.time_to_first_chunk_ms = first_chunk_time or 0
-        first_tts = result.chunks[0].tts_time_ms if run_tts else 0
-        result.time_to_first_audio_ms = result.time_to_first_chunk_ms + (first_tts or 0)
+        # Playback can start on the first PCM bytes, not the full download. The first
+        # chunk's request only goes out once its batch is full (its last chunk is detected).
+        if run_tts and tts_groups:
+            first_batch = tts_groups[0]
+            first_tts = result.chunks[0].tts_first_byte_ms
+            result.time_to_first_audio_ms = first_batch[-1].detection_time_ms + (first_tts or 0)
+        else:
+            result.time_to_first_audio_ms = result.time_to_first_chunk_ms
 
     return result
 
@@ -353,31 +596,48 @@ def print_benchmark_result(result: ChunkingBenchmark):
 
     print(f"\nCHUNKS ({len(result.chunks)} total):")
     for i, chunk in enumerate(result.chunks):
-        tts_str = f", TTS: {chunk.tts_time_ms:.0f}ms" if chunk.tts_time_ms else ""
+        tts_str = (
+            f", TTS: {chunk.tts_time_ms:.0f}ms (first byte {chunk.tts_first_byte_ms:.0f}ms)"
+            if chunk.tts_time_ms else ""
+        )
         print(f"  {i+1}. [{chunk.char_count} chars{tts_str}] {chunk.text[:60]}{'...' if len(chunk.text) > 60 else ''}")
 
     print(f"\nSTATISTICS:")
     if result.chunks:
         sizes = [c.char_count for c in result.chunks]
         tts_times = [c.tts_time_ms for c in result.chunks if c.tts_time_ms and c.tts_time_ms > 0]
+        first_bytes = [c.tts_first_byte_ms for c in result.chunks if c.tts_first_byte_ms and c.tts_first_byte_ms > 0]
         print(f"  Avg chunk size:      {sum(sizes)/len(sizes):.0f} chars")
         print(f"  Min/Max chunk size:  {min(sizes)} / {max(sizes)} chars")
         if tts_times:
             print(f"  Avg TTS time:        {sum(tts_times)/len(tts_times):.0f}ms")
             print(f"  Min/Max TTS time:    {min(tts_times):.0f} / {max(tts_times):.0f}ms")
+        if first_bytes:
+            print(f"  Avg TTS first byte:  {sum(first_bytes)/len(first_bytes):.0f}ms")
 
 
-def compare_modes(prompt: str, run_tts: bool = True):
-    """Compare sentence vs paragraph mode for a prompt."""
+async def compare_modes(
+    client: httpx.AsyncClient, prompt: str, run_tts: bool = True, concurrent: bool = False
+):
+    """Compare sentence vs paragraph mode for a prompt.
+
+    The modes run one after the other unless concurrent is set: concurrent runs
+    share the GPU, so their TTS timings include each other's queueing.
+    """
+    if concurrent:
+        sentence_result, paragraph_result = await asyncio.gather(
+            run_chunking_benchmark(client, prompt, "sentence", run_tts),
+            run_chunking_benchmark(client, prompt, "paragraph", run_tts),
+        )
+    else:
+        sentence_result = await run_chunking_benchmark(client, prompt, "sentence", run_tts)
+        paragraph_result = await run_chunking_benchmark(client, prompt, "paragraph", run_tts)
+
     print(f"\n{'#' * 70}")
     print(f"COMPARING CHUNK MODES")
     print(f"Prompt: {prompt[:60]}...")
     print(f"{'#' * 70}")
 
-    # Run both modes
-    sentence_result = run_chunking_benchmark(prompt, "sentence", run_tts)
-    paragraph_result = run_chunking_benchmark(prompt, "paragraph", run_tts)
-
     # Print individual results
     print_benchmark_result(sentence_result)
     print_benchmark_result(paragraph_result)
@@ -412,6 +672,36 @@ def compare_modes(prompt: str, run_tts: bool = True):
     return sentence_result, paragraph_result
 
 
+async def run_benchmarks(
+    prompts: List[str], mode: Optional[str], run_tts: bool, concurrent: bool = False
+) -> List[tuple[str, ChunkingBenchmark]]:
+    """Run all prompts over one client. Returns (mode, result) pairs in prompt order.
+
+    Prompts run one at a time so each run has the voice backend's GPU to itself;
+    with concurrent, they all run at once (faster, but timings include queueing).
+    """
+    async def run_all(coros):
+        if concurrent:
+            return await asyncio.gather(*coros)
+        return [await coro for coro in coros]
+
+    async with httpx.AsyncClient(limits=CLIENT_LIMITS, http2=HTTP2_AVAILABLE) as client:
+        if mode:
+            results = await run_all(
+                [run_chunking_benchmark(client, prompt, mode, run_tts) for prompt in prompts]
+            )
+            for result in results:
+                print_benchmark_result(result)
+            return [(mode, result) for result in results]
+
+        all_results = []
+        compared = await run_all([compare_modes(client, prompt, run_tts, concurrent) for prompt in prompts])
+        for sentence, paragraph in compared:
+            all_results.append(("sentence", sentence))
+            all_results.append(("paragraph", paragraph))
+        return all_results
+
+
 def main():
     parser = argparse.ArgumentParser(description="TTS Chunking Benchmark")
     parser.add_argument("--mode", choices=["sentence", "paragraph"],
@@ -422,7 +712,21 @@ def main():
                         help="Custom prompt to test")
     parser.add_argument("--all", action="store_true",
                         help="Run all test prompts")
+    parser.add_argument("--no-tts-cache", action="store_true",
+                        help="Re-synthesize repeated chunks instead of reusing cached TTS times")
+    parser.add_argument("--tts-batch", type=int, default=1, metavar="N",
+                        help="Send N chunks per /synthesize_batch request "
+                             f"(default: 1 = per-chunk requests, max {TTS_BATCH_MAX})")
+    parser.add_argument("--concurrent", action="store_true",
+                        help="Run prompts and modes at the same time (faster, but they share the "
+                             "TTS GPU, so timings include queueing)")
     args = parser.parse_args()
+    if args.tts_batch > TTS_BATCH_MAX:
+        parser.error(f"--tts-batch is limited to {TTS_BATCH_MAX} (the server's batch size limit)")
+
+    global tts_cache_enabled, tts_batch_size
+    tts_cache_enabled = not args.no_tts_cache
+    tts_batch_size = max(1, args.tts_batch)
 
     prompts = TEST_PROMPTS if args.all else [args.prompt or TEST_PROMPTS[0]]
     run_tts = not args.no_tts
@@ -434,12 +738,15 @@ def main():
     print(f"  Agent API: {AGENT_API_URL}")
     print(f"  Voice Backend: {VOICE_BACKEND_URL}")
     print(f"  Run TTS: {run_tts}")
+    print(f"  TTS cache: {'on (benchmark-only)' if tts_cache_enabled else 'off'}")
+    print(f"  TTS batch size: {tts_batch_size}")
     print(f"  Mode: {args.mode or 'compare both'}")
+    print(f"  Concurrent runs: {args.concurrent}")
     print(f"  Prompts: {len(prompts)}")
 
     # Check services are running
     try:
-        requests.get(f"{AGENT_API_URL}/health", timeout=5)
+        httpx.get(f"{AGENT_API_URL}/health", timeout=5)
         print(f"\n  Agent API: OK")
     except:
         print(f"\n  Agent API: NOT RUNNING - start with: pnpm --filter @iris/agent-core dev")
@@ -447,23 +754,14 @@ def main():
 
     if run_tts:
         try:
-            requests.get(f"{VOICE_BACKEND_URL}/health", timeout=5)
+            httpx.get(f"{VOICE_BACKEND_URL}/health", timeout=5)
             print(f"  Voice Backend: OK")
         except:
             print(f"  Voice Backend: NOT RUNNING - start with: cd packages/voice-backend && python -m src.main")
             sys.exit(1)
 
     # Run benchmarks
-    all_results = []
-    for prompt in prompts:
-        if args.mode:
-            result = run_chunking_benchmark(prompt, args.mode, run_tts)
-            print_benchmark_result(result)
-            all_results.append((args.mode, result))
-        else:
-            sentence, paragraph = compare_modes(prompt, run_tts)
-            all_results.append(("sentence", sentence))
-            all_results.append(("paragraph", paragraph))
+    all_results = asyncio.run(run_benchmarks(prompts, args.mode, run_tts, args.concurrent))
 
     # Final summary
     print(f"\n{'#' * 70}")
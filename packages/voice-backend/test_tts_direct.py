@@ -1,8 +1,8 @@
 #!/usr/bin/env python3
 """Direct TTS test script - bypasses web layer entirely."""
 
+import struct
 import sys
-import wave
 import numpy as np
 from pathlib import Path
 
@@ -43,42 +43,40 @@ def main():
     output_path.write_bytes(wav_bytes)
     print(f"    - Saved to: {output_path}")
 
-    # Verify WAV file structure
+    # Verify WAV structure from the in-memory bytes (no re-read from disk)
     print("\n[5] Verifying WAV file structure...")
-    with wave.open(str(output_path), 'rb') as wf:
-        print(f"    - Channels: {wf.getnchannels()}")
-        print(f"    - Sample width: {wf.getsampwidth()} bytes ({wf.getsampwidth() * 8} bits)")
-        print(f"    - Frame rate: {wf.getframerate()} Hz")
-        print(f"    - Frames: {wf.getnframes()}")
-        print(f"    - Duration: {wf.getnframes() / wf.getframerate():.2f} seconds")
-
-        # Read and verify audio data
-        raw_data = wf.readframes(wf.getnframes())
-        audio_array = np.frombuffer(raw_data, dtype=np.int16)
-        print(f"    - Audio samples: {len(audio_array)}")
-        print(f"    - Audio min/max: {audio_array.min()} / {audio_array.max()}")
-
-        # Check for silence or clipping
-        if audio_array.max() == audio_array.min():
-            print("    - WARNING: Audio is silent (all samples identical)")
-        elif abs(audio_array.max()) > 32000 or abs(audio_array.min()) > 32000:
-            print("    - WARNING: Audio may be clipping")
-        else:
-            print("    - Audio levels look normal")
-
-    # Also save raw PCM (what we send over WebSocket)
-    print("\n[6] Extracting raw PCM (what WebSocket sends)...")
+    (riff, _, wave_id, fmt_id, _, _, channels, frame_rate, _, _, bits,
+     data_id, data_size) = struct.unpack("<4sI4s4sIHHIIHH4sI", wav_bytes[:44])
+    if (riff, wave_id, fmt_id, data_id) != (b"RIFF", b"WAVE", b"fmt ", b"data"):
+        print("    - WARNING: Unexpected WAV header layout")
+    frames = data_size // (channels * bits // 8)
+    print(f"    - Channels: {channels}")
+    print(f"    - Sample width: {bits // 8} bytes ({bits} bits)")
+    print(f"    - Frame rate: {frame_rate} Hz")
+    print(f"    - Frames: {frames}")
+    print(f"    - Duration: {frames / frame_rate:.2f} seconds")
+
+    # Raw PCM is what we send over WebSocket; decode it once for both checks
     pcm_data = wav_bytes[44:]  # Strip 44-byte WAV header
+    pcm_array = np.frombuffer(pcm_data, dtype=np.int16)
+    pcm_min, pcm_max = pcm_array.min(), pcm_array.max()
+    print(f"    - Audio samples: {len(pcm_array)}")
+    print(f"    - Audio min/max: {pcm_min} / {pcm_max}")
+
+    # Check for silence or clipping
+    if pcm_max == pcm_min:
+        print("    - WARNING: Audio is silent (all samples identical)")
+    elif abs(pcm_max) > 32000 or abs(pcm_min) > 32000:
+        print("    - WARNING: Audio may be clipping")
+    else:
+        print("    - Audio levels look normal")
+
+    print("\n[6] Extracting raw PCM (what WebSocket sends)...")
     pcm_path = Path("/tmp/tts_direct_test.pcm")
     pcm_path.write_bytes(pcm_data)
     print(f"    - PCM size: {len(pcm_data)} bytes")
     print(f"    - Saved to: {pcm_path}")
 
-    # Verify PCM data
-    pcm_array = np.frombuffer(pcm_data, dtype=np.int16)
-    print(f"    - PCM samples: {len(pcm_array)}")
-    print(f"    - PCM min/max: {pcm_array.min()} / {pcm_array.max()}")
-
     print("\n" + "=" * 60)
     print("TEST COMPLETE")
     print("=" * 60)
@@ -5,6 +5,11 @@ Voice Flow Test - Automated test with audio slate announcements.
 Tests the full pipeline: STT (simulated) -> Ollama LLM -> TTS -> Play audio
 Uses Ollama directly for fast local inference (not Claude Cloud).
 
+The stages are pipelined: the LLM reply is streamed, split into sentences,
+and each sentence is synthesized and played as soon as it is complete, so
+time-to-first-audio is (first sentence LLM + first sentence TTS) rather than
+(full LLM + full TTS).
+
 IMPORTANT: Uses num_predict option for consistent fast latency.
 Without num_predict, Ollama has ~3s overhead even for short responses.
 With num_predict=100, latency drops to ~100-150ms.
@@ -18,17 +23,19 @@ Usage:
 """
 
 import os
+import queue
 import sys
+import threading
 import time
 import json
-import requests
 import numpy as np
-import scipy.io.wavfile as wav
 import subprocess
-import tempfile
 import argparse
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 
-# Setup cuDNN before imports
+# Setup cuDNN before the TTS import (done in main, after argument parsing)
 def _setup_cudnn():
     try:
         import nvidia.cudnn
@@ -39,9 +46,7 @@ def _setup_cudnn():
     except:
         pass
 
-_setup_cudnn()
-
-from src.tts_kokoro import get_kokoro_tts
+from test_tts_chunking import TextChunker
 
 # IRIS system prompt for voice responses
 SYSTEM_PROMPT = """You are IRIS, the AI assistant for Star Atlas players.
@@ -53,43 +58,111 @@ Be helpful, friendly, and concise. No markdown or special formatting."""
 NUM_PREDICT = 100
 
 
+def make_session() -> requests.Session:
+    """Create a keep-alive session so repeated calls reuse pooled connections."""
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(pool_connections=2, pool_maxsize=8, max_retries=0))
+    return session
+
+
+# Keep-alive session: warmup and every test reuse the same Ollama connection
+_ollama_session = make_session()
+
+
+def open_player(sample_rate=24000) -> subprocess.Popen:
+    """Start aplay reading raw mono int16 PCM from stdin."""
+    return subprocess.Popen(
+        ["aplay", "-q", "-f", "S16_LE", "-r", str(sample_rate), "-c", "1"],
+        stdin=subprocess.PIPE,
+    )
+
+
+def close_player(player: subprocess.Popen):
+    """Close aplay's stdin and wait for it to finish playing what it was sent."""
+    player.stdin.close()
+    if player.wait() != 0:
+        raise subprocess.CalledProcessError(player.returncode, player.args)
+
+
 def play_audio(audio_data, sample_rate=24000):
-    """Play audio using aplay."""
-    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-        wav.write(f.name, sample_rate, audio_data)
-        subprocess.run(["aplay", "-q", f.name], check=True)
-        os.unlink(f.name)
+    """Play int16 audio by piping raw PCM into aplay (no temp WAV file)."""
+    player = open_player(sample_rate)
+    player.stdin.write(audio_data.tobytes())
+    close_player(player)
 
 
-def call_ollama(model: str, prompt: str) -> tuple[str, float]:
-    """Call Ollama directly for fast local inference.
+def stream_ollama(model: str, prompt: str):
+    """Stream a reply from Ollama, yielding text tokens as they arrive.
 
     Uses num_predict option for consistent low latency.
     Without it, Ollama has ~3s overhead even for tiny responses.
     """
-    start = time.perf_counter()
-
-    response = requests.post(
+    with _ollama_session.post(
         "http://localhost:11434/api/generate",
         json={
             "model": model,
             "prompt": prompt,
             "system": SYSTEM_PROMPT,
-            "stream": False,
+            "stream": True,
             "options": {
                 "num_predict": NUM_PREDICT,  # CRITICAL: limits tokens for fast response
             },
         },
+        stream=True,
         timeout=30,
-    )
+    ) as response:
+        if response.status_code != 200:
+            return
+
+        # NDJSON: one {"response": "...", "done": bool} object per line
+        for line in response.iter_lines():
+            if not line:
+                continue
+            data = json.loads(line)
+            token = data.get("response", "")
+            if token:
+                yield token
+            if data.get("done"):
+                break
+
 
+def call_ollama(model: str, prompt: str) -> tuple[str, float]:
+    """Call Ollama directly for fast local inference and wait for the full reply."""
+    start = time.perf_counter()
+    text = "".join(stream_ollama(model, prompt))
     elapsed = (time.perf_counter() - start) * 1000
+    return text.strip(), elapsed
+
 
-    if response.status_code != 200:
-        return "", elapsed
+def synthesize_timed(tts, text: str):
+    """Synthesize text, returning (SynthesisResult, tts_ms)."""
+    start = time.perf_counter()
+    tts_result = tts.synthesize(text)
+    return tts_result, (time.perf_counter() - start) * 1000
 
-    result = response.json()
-    return result.get("response", "").strip(), elapsed
+
+def _playback_worker(play_queue: queue.Queue, first_audio: list):
+    """Play synthesized sentences in order until a None sentinel arrives.
+
+    Records the perf_counter time the first sentence starts playing in first_audio.
+    All sentences go to one long-lived aplay process, so there is no gap to spawn
+    a player between them.
+    """
+    player = None
+    try:
+        while True:
+            future = play_queue.get()
+            if future is None:
+                return
+            tts_result, _ = future.result()
+            if player is None:
+                player = open_player(tts_result.sample_rate)
+            if not first_audio:
+                first_audio.append(time.perf_counter())
+            player.stdin.write(tts_result.to_int16().tobytes())
+    finally:
+        if player is not None:
+            close_player(player)
 
 
 def announce_slate(tts, model: str, take: int):
@@ -109,14 +182,18 @@ def announce_slate(tts, model: str, take: int):
     slate_time = (time.perf_counter() - start) * 1000
     print(f"   (TTS: {slate_time:.0f}ms)")
 
-    audio_int16 = (tts_result.audio.squeeze() * 32767).astype(np.int16)
-    play_audio(audio_int16, tts_result.sample_rate)
+    play_audio(tts_result.to_int16(), tts_result.sample_rate)
 
     time.sleep(0.3)  # Brief pause after slate
 
 
 def test_voice_flow(tts, query: str, model: str, take: int = 1, use_slate: bool = True):
-    """Test full voice flow: Slate -> Ollama LLM -> TTS -> Play."""
+    """Test full voice flow: Slate -> Ollama LLM -> TTS -> Play.
+
+    Returns (llm_ms, tts_ms, first_audio_ms, wall_ms). The stages overlap, so
+    llm_ms + tts_ms is not a latency; first_audio_ms (None if nothing played)
+    and wall_ms (until the last sentence finished playing) are.
+    """
 
     # Big banner showing current model
     print(f"\n{'#'*60}")
@@ -129,33 +206,59 @@ def test_voice_flow(tts, query: str, model: str, take: int = 1, use_slate: bool
     if use_slate:
         announce_slate(tts, model, take)
 
-    # Step 1: Call Ollama directly
-    print(f"\n[1] LLM: Generating with {model}...")
-    text, llm_time = call_ollama(model, query)
+    # Stream LLM -> sentence chunker -> TTS (1 worker, keeps order) -> playback thread
+    print(f"\n[1] LLM: Streaming from {model} (sentence-by-sentence TTS + playback)...")
+    chunker = TextChunker(mode="sentence", min_size=1)
+    play_queue: queue.Queue = queue.Queue()
+    first_audio: list[float] = []
+    tts_futures = []
+    text_parts = []
+
+    player = threading.Thread(target=_playback_worker, args=(play_queue, first_audio), daemon=True)
+    player.start()
 
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        def submit(sentence: str):
+            future = executor.submit(synthesize_timed, tts, sentence)
+            tts_futures.append(future)
+            play_queue.put(future)
+
+        try:
+            for token in stream_ollama(model, query):
+                text_parts.append(token)
+                for sentence in chunker.add(token):
+                    submit(sentence)
+            llm_time = (time.perf_counter() - start) * 1000
+
+            remaining = chunker.flush()
+            if remaining:
+                submit(remaining)
+        finally:
+            play_queue.put(None)
+            player.join()
+    wall_time = (time.perf_counter() - start) * 1000
+    first_audio_time = (first_audio[0] - start) * 1000 if first_audio else None
+
+    text = "".join(text_parts).strip()
     print(f"    Time: {llm_time:.0f}ms")
-    if text:
-        display = text[:80] + "..." if len(text) > 80 else text
-        print(f"    Response: \"{display}\"")
-    else:
+    if not text:
         print("    [No response]")
-        return llm_time, 0
+        return llm_time, 0, first_audio_time, wall_time
 
-    # Step 2: TTS
-    print(f"[2] TTS: Synthesizing...")
-    start = time.perf_counter()
-    tts_result = tts.synthesize(text)
-    tts_time = (time.perf_counter() - start) * 1000
-    print(f"    Time: {tts_time:.0f}ms | Audio: {tts_result.duration_seconds:.1f}s")
+    display = text[:80] + "..." if len(text) > 80 else text
+    print(f"    Response: \"{display}\"")
 
-    # Step 3: Play audio with model announcement
-    print(f"[3] 🔊 Playing: [{model}]")
-    audio_int16 = (tts_result.audio.squeeze() * 32767).astype(np.int16)
-    play_audio(audio_int16, tts_result.sample_rate)
+    tts_times = [future.result()[1] for future in tts_futures]
+    tts_time = sum(tts_times)
+    print(f"[2] TTS: {len(tts_times)} sentence(s), {tts_time:.0f}ms total synthesis")
+    if first_audio_time is not None:
+        print(f"[3] 🔊 Played: [{model}] | Time to first audio: {first_audio_time:.0f}ms")
 
-    total = llm_time + tts_time
-    print(f"\n>>> {model}: {total:.0f}ms total (LLM: {llm_time:.0f}ms + TTS: {tts_time:.0f}ms)")
-    return llm_time, tts_time
+    first = f"{first_audio_time:.0f}ms" if first_audio_time is not None else "n/a"
+    print(f"\n>>> {model}: first audio {first}, playback done at {wall_time:.0f}ms "
+          f"(LLM stream: {llm_time:.0f}ms, TTS synthesis: {tts_time:.0f}ms, overlapped)")
+    return llm_time, tts_time, first_audio_time, wall_time
 
 
 def main():
@@ -188,16 +291,24 @@ def main():
     print(f"Slates: {'ON (film-style audio announcements)' if use_slate else 'OFF'}")
     print(f"Token limit: {NUM_PREDICT} (for fast inference)")
 
-    # Pre-load TTS
-    print("\nLoading TTS model...")
-    tts = get_kokoro_tts("cuda")
-    print("TTS ready!")
-
-    # Warm up Ollama
-    print("\nWarming up Ollama...")
-    for model in models:
-        call_ollama(model, "Hello")
-    print("Ollama warm!\n")
+    # Deferred so --help and bad arguments don't pay for CUDA/Kokoro initialization
+    _setup_cudnn()
+    from src.tts_kokoro import get_kokoro_tts
+
+    def load_tts():
+        # get_kokoro_tts is lazy (the model loads on first use), so synthesize
+        # one word here to load it and warm up CUDA alongside Ollama
+        tts = get_kokoro_tts("cuda")
+        tts.synthesize("Ready.")
+        return tts
+
+    # Load TTS and warm up every Ollama model concurrently
+    print("\nLoading TTS model and warming up Ollama...")
+    with ThreadPoolExecutor(max_workers=len(models) + 1) as executor:
+        tts_future = executor.submit(load_tts)
+        list(executor.map(lambda model: call_ollama(model, "Hello"), models))
+        tts = tts_future.result()
+    print("TTS ready! Ollama warm!\n")
 
     results = {}
     take_counter = {}  # Track takes per model
@@ -209,13 +320,13 @@ def main():
         for query in queries:
             take_counter[model] += 1
             try:
-                llm_t, tts_t = test_voice_flow(
+                timings = test_voice_flow(
                     tts, query, model,
                     take=take_counter[model],
                     use_slate=use_slate
                 )
-                if llm_t:
-                    results[model].append((llm_t, tts_t))
+                if timings[0]:
+                    results[model].append(timings)
                 time.sleep(0.5)  # Pause between tests
             except Exception as e:
                 print(f"Error: {e}")
@@ -230,7 +341,11 @@ def main():
         if times:
             avg_llm = np.mean([t[0] for t in times])
             avg_tts = np.mean([t[1] for t in times])
-            print(f"{model:20s}: LLM={avg_llm:6.0f}ms, TTS={avg_tts:5.0f}ms, Total={avg_llm+avg_tts:6.0f}ms")
+            first_audio = [t[2] for t in times if t[2] is not None]
+            avg_first = f"{np.mean(first_audio):6.0f}ms" if first_audio else "   n/a  "
+            avg_wall = np.mean([t[3] for t in times])
+            print(f"{model:20s}: First audio={avg_first}, LLM={avg_llm:6.0f}ms, "
+                  f"TTS={avg_tts:5.0f}ms, Wall={avg_wall:6.0f}ms")
 
 
 if __name__ == "__main__":
@@ -4,9 +4,14 @@ Interactive Kokoro voice tester.
 Press number keys to hear different voices with the same phrase.
 """
 
+import atexit
+import hashlib
 import os
 import subprocess
-import tempfile
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
 from pathlib import Path
 
 # Suppress warnings
@@ -16,12 +21,72 @@ warnings.filterwarnings('ignore')
 print("Loading Kokoro model (one-time, ~2s)...")
 from kokoro import KPipeline
 import numpy as np
-import scipy.io.wavfile as wavfile
+import torch
 
 # Load model once - voices switch instantly after this
 pipe = KPipeline(lang_code='a', device='cuda', repo_id='hexgrad/Kokoro-82M')
 print("Model loaded! Voice switching is now instant.\n")
 
+SAMPLE_RATE = 24000  # Kokoro output rate
+
+# Opt-in reduced precision (KOKORO_AMP=fp16 or bf16). Off by default: this tool is for
+# judging voice quality, so compare against fp32 before relying on it.
+AMP_DTYPE = {"fp16": torch.float16, "bf16": torch.bfloat16}.get(os.environ.get("KOKORO_AMP", "").lower())
+if pipe.model.device.type != 'cuda':
+    AMP_DTYPE = None
+
+
+class Float32Decoder(torch.nn.Module):
+    """Runs Kokoro's iSTFTNet decoder in fp32 under autocast (its STFT has no half support)."""
+
+    def __init__(self, decoder: torch.nn.Module):
+        super().__init__()
+        self.decoder = decoder
+
+    def forward(self, *args):
+        args = [a.float() if torch.is_tensor(a) and a.is_floating_point() else a for a in args]
+        with torch.autocast('cuda', enabled=False):
+            return self.decoder(*args)
+
+
+if AMP_DTYPE is not None:
+    pipe.model.decoder = Float32Decoder(pipe.model.decoder)
+    print(f"Autocast enabled for the text/prosody stages ({AMP_DTYPE}), decoder in fp32\n")
+
+
+# One synthesis on the GPU at a time, whichever thread is asking: two Kokoro
+# forwards sharing the device are slower than running them back to back
+_gpu_lock = threading.Lock()
+
+def run_inference(results):
+    """Advance a KPipeline generator under inference mode (and autocast, if enabled).
+
+    The modes are only active while the generator computes, not while its caller plays audio.
+    """
+    while True:
+        with _gpu_lock, torch.inference_mode(), \
+                torch.autocast('cuda', dtype=AMP_DTYPE or torch.float16, enabled=AMP_DTYPE is not None):
+            result = next(results, None)
+        if result is None:
+            return
+        yield result
+
+
+def _open_output_stream():
+    """Open one long-lived int16 output stream, or return None to fall back to aplay."""
+    try:
+        import sounddevice as sd
+        stream = sd.OutputStream(samplerate=SAMPLE_RATE, channels=1, dtype='int16')
+        stream.start()
+        return stream
+    except Exception as e:  # not installed, or PortAudio can't open a device
+        print(f"sounddevice unavailable ({e}), falling back to aplay\n")
+        return None
+
+
+# Opened once: no process spawn or temp file per phrase
+output_stream = _open_output_stream()
+
 # Test voices organized by category
 VOICES = [
     # American Female (top picks)
@@ -63,109 +128,457 @@ TEST_PHRASES = [
 
 current_phrase_idx = 0
 
-def play_voice(voice_id: str, text: str):
-    """Generate and play audio for a voice."""
-    # Generate audio
-    gen = pipe(text, voice=voice_id)
-    audio_chunks = []
-    for _, _, audio in gen:
-        audio_chunks.append(audio)
-
-    if not audio_chunks:
-        print("  No audio generated!")
-        return
-
-    full_audio = np.concatenate(audio_chunks)
-
-    # Save to temp file and play
-    with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as f:
-        wavfile.write(f.name, 24000, (full_audio * 32767).astype(np.int16))
-        # Play with aplay (suppress output)
-        subprocess.run(['aplay', '-q', f.name], check=True)
-        os.unlink(f.name)
-
-def show_menu():
-    print("\n" + "="*70)
-    print("KOKORO VOICE TESTER - Enter number to hear voice")
-    print("="*70)
+# VOICES never changes, so the groupings and static menu text are built once
+VOICES_BY_PREFIX = {
+    prefix: [v for v in VOICES if v[0].startswith(prefix)]
+    for prefix in ('af_', 'bf_', 'am_', 'bm_')
+}
 
+def _build_menu_voices() -> str:
     # Group by category
     categories = {}
     for i, (vid, grade, desc) in enumerate(VOICES):
         cat = desc.split(" - ")[0] if " - " in desc else desc
-        if cat not in categories:
-            categories[cat] = []
-        categories[cat].append((i+1, vid, grade, desc))
+        categories.setdefault(cat, []).append((i+1, vid, grade, desc))
 
+    lines = ["\n" + "="*70, "KOKORO VOICE TESTER - Enter number to hear voice", "="*70]
     for cat, voices in categories.items():
-        print(f"\n  {cat}:")
+        lines.append(f"\n  {cat}:")
         for num, vid, grade, desc in voices:
             marker = " ***" if "YOUR PICK" in desc or "BEST" in desc else ""
-            print(f"    [{num:2}] {vid:15} ({grade}){marker}")
+            lines.append(f"    [{num:2}] {vid:15} ({grade}){marker}")
+    lines.append("\n" + "-"*70)
+    return "\n".join(lines)
+
+_MENU_VOICES = _build_menu_voices()
+_MENU_COMMANDS = "\n".join([
+    "  [af] Play all American Female    [bf] Play all British Female",
+    "  [am] Play all American Male      [bm] Play all British Male",
+    "  [a] Play ALL voices              [q] Quit",
+    "-"*70,
+])
+
+def prewarm_voices():
+    """Load every voice pack once and keep it on the model's device.
+
+    KPipeline.load_voice returns pipe.voices[voice] when present, so later calls
+    skip the voice-file read and the per-call host-to-device copy of the pack.
+    """
+    start = time.perf_counter()
+    device = pipe.model.device
+    loaded = 0
+    for vid, _, _ in VOICES:
+        try:
+            pipe.voices[vid] = pipe.load_voice(vid).to(device)
+            loaded += 1
+        except Exception as e:
+            print(f"  Could not preload {vid}: {e}")
+    print(f"Preloaded {loaded}/{len(VOICES)} voice packs in {time.perf_counter() - start:.1f}s")
+
+class GraphedBert(torch.nn.Module):
+    """Replays CUDA graphs of Kokoro's ALBERT text encoder for padded length buckets.
+
+    The encoder's shapes depend only on the phoneme count, so inputs are padded
+    (and masked) up to a captured bucket. The rest of the forward pass depends on
+    predicted durations and stays eager. Longer inputs run the wrapped module.
+    """
+
+    BUCKETS = (32, 64, 128, 256, 512)
+
+    def __init__(self, bert: torch.nn.Module):
+        super().__init__()
+        self.bert = bert
+        self.graphs = {}
+
+    # KModel reads these through model.bert (KModel.device is bert.device)
+    @property
+    def device(self):
+        return self.bert.device
+
+    @property
+    def config(self):
+        return self.bert.config
+
+    def _encode(self, ids, additive_mask):
+        """ALBERT's embeddings + encoder, taking a ready-made (1, 1, 1, L) additive mask.
+
+        AlbertModel.forward inspects a 2D mask on the host (the SDPA path drops an
+        all-ones mask), which is illegal during capture and would bake in "no mask".
+        """
+        hidden = self.bert.embeddings(ids)
+        head_mask = [None] * self.bert.config.num_hidden_layers
+        return self.bert.encoder(hidden, additive_mask, head_mask=head_mask)[0]
+
+    @torch.no_grad()
+    def capture(self):
+        device = self.device
+        dtype = self.bert.embeddings.word_embeddings.weight.dtype
+        for size in self.BUCKETS:
+            ids = torch.zeros((1, size), dtype=torch.long, device=device)
+            mask = torch.zeros((1, 1, 1, size), dtype=dtype, device=device)
+            # Warm up on a side stream before capturing, as torch.cuda.graph requires
+            stream = torch.cuda.Stream()
+            stream.wait_stream(torch.cuda.current_stream())
+            with torch.cuda.stream(stream):
+                for _ in range(2):
+                    self._encode(ids, mask)
+            torch.cuda.current_stream().wait_stream(stream)
+
+            graph = torch.cuda.CUDAGraph()
+            with torch.cuda.graph(graph):
+                out = self._encode(ids, mask)
+            self.graphs[size] = (graph, ids, mask, out)
+
+    def forward(self, input_ids, attention_mask=None):
+        length = input_ids.shape[-1]
+        bucket = next((b for b in self.BUCKETS if b >= length and b in self.graphs), None)
+        if bucket is None or input_ids.shape[0] != 1:
+            return self.bert(input_ids, attention_mask=attention_mask)
+
+        graph, ids, mask, out = self.graphs[bucket]
+        ids.zero_()
+        ids[:, :length] = input_ids
+        # Additive mask: 0 where attended, dtype min on padding (and masked tokens)
+        neg = torch.finfo(mask.dtype).min
+        mask.fill_(neg)
+        if attention_mask is None:
+            mask[..., :length] = 0
+        else:
+            mask[..., :length] = (1 - attention_mask.to(mask.dtype)) * neg
+        graph.replay()
+        # The graph's output buffer is overwritten by the next replay
+        return out[:, :length].clone()
+
+def _encoder_input_ids(phonemes: str) -> torch.Tensor:
+    """Token ids for a phoneme string, built the way KModel.forward builds them."""
+    ids = [i for i in map(pipe.model.vocab.get, phonemes) if i is not None]
+    return torch.tensor([[0, *ids, 0]], dtype=torch.long, device=pipe.model.device)
+
+@torch.no_grad()
+def _graphs_match_eager(graphed: GraphedBert, atol: float = 1e-3) -> bool:
+    """Compare graph replay against the eager encoder on every test phrase."""
+    worst = 0.0
+    for phrase in TEST_PHRASES:
+        for ps in phonemize(phrase):
+            ids = _encoder_input_ids(ps)
+            mask = torch.ones_like(ids, dtype=torch.int)
+            expected = graphed.bert(ids, attention_mask=mask)
+            actual = graphed(ids, attention_mask=mask)
+            worst = max(worst, (actual - expected).abs().max().item())
+    if worst > atol:
+        print(f"CUDA graph output differs from eager (max abs diff {worst:.2e}), not using graphs")
+        return False
+    return True
+
+def capture_cuda_graphs():
+    """Swap the model's text encoder for its CUDA-graphed version when KOKORO_CUDA_GRAPHS=1.
+
+    Opt-in (CUDA only): graphs are checked against the eager encoder on the test
+    phrases at startup and only installed if they match.
+    """
+    if os.environ.get("KOKORO_CUDA_GRAPHS") != "1" or pipe.model.device.type != 'cuda':
+        return
+    start = time.perf_counter()
+    graphed = GraphedBert(pipe.model.bert)
+    try:
+        graphed.capture()
+        if not _graphs_match_eager(graphed):
+            return
+    except Exception as e:  # e.g. a transformers version whose ALBERT internals differ
+        print(f"CUDA graph capture failed ({e}), using the eager text encoder")
+        return
+    pipe.model.bert = graphed
+    print(f"Captured text-encoder CUDA graphs for {len(graphed.graphs)} length buckets "
+          f"in {time.perf_counter() - start:.1f}s")
+
+def compile_decoder():
+    """torch.compile the decoder when KOKORO_COMPILE=1, paying the compile cost at startup.
+
+    Only the decoder is compiled: it dominates the compute, while the duration
+    alignment before it is data-dependent and would graph-break anyway.
+    dynamic=True avoids recompiling for every utterance length.
+    """
+    if os.environ.get("KOKORO_COMPILE") != "1":
+        return
+    start = time.perf_counter()
+    pipe.model.decoder = torch.compile(pipe.model.decoder, dynamic=True)
+    for _ in range(2):
+        for _ in run_inference(pipe(TEST_PHRASES[0], voice=VOICES[0][0])):
+            pass
+    print(f"Compiled decoder in {time.perf_counter() - start:.1f}s")
+
+# Float32 scratch for clipping, grown on demand (20s of audio covers every test phrase)
+_scratch = np.empty(SAMPLE_RATE * 20, dtype=np.float32)
 
-    print("\n" + "-"*70)
+def to_pcm16(audio, out: np.ndarray | None = None) -> np.ndarray:
+    """Convert a Kokoro audio chunk (float, nominally [-1, 1]) to int16 PCM.
+
+    Samples are clipped first: Kokoro can overshoot slightly, and an unclipped
+    cast wraps around to an audible click. No full-size float temporary is allocated.
+    If out is given (an int16 array of the chunk's length), the samples are written there.
+    """
+    global _scratch
+    # KModel already moved the audio to the CPU, so this wraps the tensor without copying
+    audio = np.asarray(audio).reshape(-1)
+    if audio.size > _scratch.size:
+        _scratch = np.empty(audio.size, dtype=np.float32)
+    buf = _scratch[:audio.size]
+    np.clip(audio, -1.0, 1.0, out=buf)
+    # A new int16 array per chunk unless told otherwise: chunks are kept in the audio cache
+    if out is None:
+        out = np.empty(audio.size, dtype=np.int16)
+    return np.multiply(buf, 32767, out=out, casting='unsafe')
+
+def play_pcm_chunks(chunks):
+    """Play int16 PCM chunks in order on the persistent output stream (or through aplay)."""
+    if output_stream is not None:
+        for pcm in chunks:
+            output_stream.write(pcm)
+        return
+
+    aplay = _get_aplay()
+    try:
+        for pcm in chunks:
+            aplay.stdin.write(pcm.tobytes())
+    except BrokenPipeError:
+        raise subprocess.CalledProcessError(aplay.wait(), aplay.args) from None
+
+# Fallback player: one aplay reading raw PCM from stdin for the whole session
+_aplay = None
+
+def _get_aplay() -> subprocess.Popen:
+    """Return the long-lived aplay process, (re)starting it if it isn't running."""
+    global _aplay
+    if _aplay is None or _aplay.poll() is not None:
+        _aplay = subprocess.Popen(['aplay', '-q', '-f', 'S16_LE', '-r', str(SAMPLE_RATE), '-c', '1', '-'],
+                                  stdin=subprocess.PIPE, bufsize=0)
+    return _aplay
+
+@atexit.register
+def _close_aplay():
+    """Let aplay finish whatever is still queued before the tester exits."""
+    if _aplay is not None and _aplay.poll() is None:
+        _aplay.stdin.close()
+        _aplay.wait()
+
+# Rendered int16 audio per (voice_id, text): replaying a voice/phrase skips Kokoro entirely
+AUDIO_CACHE_SIZE = 64
+_audio_cache: "OrderedDict[tuple[str, str], np.ndarray]" = OrderedDict()
+
+# On-disk tier (raw int16 PCM) so relaunching the tester replays without touching the GPU
+CACHE_DIR = Path(os.environ.get("KOKORO_TESTER_CACHE", Path.home() / ".cache" / "kokoro_tester"))
+
+def _disk_cache_path(key: tuple[str, str]) -> Path:
+    # Reduced-precision runs sound slightly different, so they get their own entries
+    voice_id, text = key
+    digest = hashlib.md5(f"{voice_id}|{AMP_DTYPE}|{text}".encode()).hexdigest()
+    return CACHE_DIR / f"{voice_id}-{digest}.pcm"
+
+def get_cached_audio(key: tuple[str, str]) -> np.ndarray | None:
+    """Rendered int16 PCM for (voice_id, text) from memory, then disk, or None."""
+    pcm = _audio_cache.get(key)
+    if pcm is not None:
+        _audio_cache.move_to_end(key)
+        return pcm
+    try:
+        pcm = np.fromfile(_disk_cache_path(key), dtype=np.int16)
+    except OSError:
+        return None
+    cache_audio(key, pcm, persist=False)
+    return pcm
+
+# Phoneme chunks per phrase: G2P runs once per phrase, not once per voice
+_phoneme_cache: dict[str, list[str]] = {}
+
+def phonemize(text: str) -> list[str]:
+    """Phoneme chunks for text, split the same way KPipeline does for English voices."""
+    phonemes = _phoneme_cache.get(text)
+    if phonemes is None:
+        _, tokens = pipe.g2p(text)
+        phonemes = _phoneme_cache[text] = [ps for _, ps, _ in pipe.en_tokenize(tokens) if ps]
+    return phonemes
+
+def prephonemize():
+    """Phonemize every test phrase up front so no voice ever waits on G2P."""
+    start = time.perf_counter()
+    for phrase in TEST_PHRASES:
+        phonemize(phrase)
+    print(f"Phonemized {len(TEST_PHRASES)} phrases in {time.perf_counter() - start:.2f}s")
+
+def play_voice(voice_id: str, text: str):
+    """Generate and play audio for a voice, playing each chunk as soon as Kokoro yields it.
+
+    The cached phonemes go straight to the model (KPipeline.generate_from_tokens), skipping G2P.
+    """
+    key = (voice_id, text)
+    cached = get_cached_audio(key)
+    if cached is not None:
+        play_pcm_chunks([cached])
+        return
+
+    rendered = []
+
+    def synthesize():
+        for pcm in generate_pcm(voice_id, text):
+            rendered.append(pcm)
+            yield pcm
+
+    play_pcm_chunks(synthesize())
+
+    if not rendered:
+        print("  No audio generated!")
+        return
+
+    cache_audio(key, np.concatenate(rendered))
+
+def generate_audio(voice_id: str, text: str):
+    """Yield Kokoro's float audio chunks for text, straight from the cached phonemes."""
+    for ps in phonemize(text):
+        for _, _, audio in run_inference(pipe.generate_from_tokens(ps, voice=voice_id)):
+            yield audio
+
+def generate_pcm(voice_id: str, text: str):
+    """Yield int16 PCM chunks for text as Kokoro produces them."""
+    for audio in generate_audio(voice_id, text):
+        yield to_pcm16(audio)
+
+def cache_audio(key: tuple[str, str], pcm: np.ndarray, persist: bool = True):
+    _audio_cache[key] = pcm
+    if len(_audio_cache) > AUDIO_CACHE_SIZE:
+        _audio_cache.popitem(last=False)
+    if not persist:
+        return
+    path = _disk_cache_path(key)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        pcm.tofile(tmp)
+        os.replace(tmp, path)  # atomic: a crash never leaves a truncated clip behind
+    except OSError as e:
+        print(f"(disk cache write failed: {e})", end=" ")
+
+# Whole-clip int16 assembly buffer for synthesize_voice, grown on demand.
+# Only the single prefetch worker uses it.
+_voice_buf = np.empty(SAMPLE_RATE * 20, dtype=np.int16)
+
+def synthesize_voice(voice_id: str, text: str) -> np.ndarray | None:
+    """Full int16 PCM for a voice (from the cache if possible), or None if Kokoro produced nothing."""
+    key = (voice_id, text)
+    cached = get_cached_audio(key)
+    if cached is not None:
+        return cached
+    global _voice_buf
+    off = 0
+    for audio in generate_audio(voice_id, text):
+        n = audio.numel() if torch.is_tensor(audio) else np.size(audio)
+        if off + n > _voice_buf.size:
+            grown = np.empty(max(2 * _voice_buf.size, off + n), dtype=np.int16)
+            grown[:off] = _voice_buf[:off]
+            _voice_buf = grown
+        to_pcm16(audio, out=_voice_buf[off:off + n])
+        off += n
+    if not off:
+        return None
+    pcm = _voice_buf[:off].copy()
+    cache_audio(key, pcm)
+    return pcm
+
+def show_menu():
+    print(_MENU_VOICES)
     print(f"  [p] Change phrase (current: {current_phrase_idx+1}/{len(TEST_PHRASES)})")
-    print(f"  [af] Play all American Female    [bf] Play all British Female")
-    print(f"  [am] Play all American Male      [bm] Play all British Male")
-    print(f"  [a] Play ALL voices              [q] Quit")
-    print("-"*70)
+    print(_MENU_COMMANDS)
     print(f"Phrase: \"{TEST_PHRASES[current_phrase_idx]}\"")
 
+# Renders the next voice while the current one plays
+_synth_executor = ThreadPoolExecutor(max_workers=1)
+
+def play_voices(voices, text: str):
+    """Play one phrase in several voices, synthesizing voice N+1 while voice N plays."""
+    if not voices:
+        return
+    future = _synth_executor.submit(synthesize_voice, voices[0][0], text)
+    try:
+        for i, (vid, grade, desc) in enumerate(voices):
+            print(f"  {vid} ({grade})...", end=" ", flush=True)
+            pcm = future.result()
+            if i + 1 < len(voices):
+                future = _synth_executor.submit(synthesize_voice, voices[i + 1][0], text)
+            if pcm is None:
+                print("No audio generated!")
+                continue
+            play_pcm_chunks([pcm])
+            print("done")
+    finally:
+        # On Ctrl-C or a playback error, don't leave a prefetch racing the next command
+        if not future.cancel():
+            wait([future])
+
 def play_category(prefix: str, name: str):
     """Play all voices starting with prefix."""
     print(f"\nPlaying all {name} voices...")
-    for vid, grade, desc in VOICES:
-        if vid.startswith(prefix):
-            print(f"  {vid} ({grade})...", end=" ", flush=True)
-            play_voice(vid, TEST_PHRASES[current_phrase_idx])
-            print("done")
+    play_voices(VOICES_BY_PREFIX[prefix], TEST_PHRASES[current_phrase_idx])
 
-def main():
+def _quit():
+    print("Goodbye!")
+    return False
+
+def _next_phrase():
     global current_phrase_idx
+    current_phrase_idx = (current_phrase_idx + 1) % len(TEST_PHRASES)
+    print(f"\nNew phrase: \"{TEST_PHRASES[current_phrase_idx]}\"")
+
+def _play_all():
+    print("\nPlaying all voices...")
+    play_voices(VOICES, TEST_PHRASES[current_phrase_idx])
+
+def _play_number(choice: str):
+    idx = int(choice) - 1
+    if not 0 <= idx < len(VOICES):
+        print(f"Invalid number (1-{len(VOICES)})")
+        return
+    vid, grade, desc = VOICES[idx]
+    print(f"  Playing {vid}...", end=" ", flush=True)
+    play_voice(vid, TEST_PHRASES[current_phrase_idx])
+    print("done")
+
+COMMANDS = {
+    'q': _quit,
+    'p': _next_phrase,
+    'a': _play_all,
+    'af': lambda: play_category('af_', 'American Female'),
+    'bf': lambda: play_category('bf_', 'British Female'),
+    'am': lambda: play_category('am_', 'American Male'),
+    'bm': lambda: play_category('bm_', 'British Male'),
+    '': show_menu,
+}
+
+# What synthesis/playback can raise: CUDA and model errors, a dead audio device or aplay pipe
+PLAYBACK_ERRORS = (RuntimeError, OSError, ValueError, subprocess.CalledProcessError)
+if output_stream is not None:
+    import sounddevice as sd
+    PLAYBACK_ERRORS += (sd.PortAudioError,)
 
+def main():
+    prewarm_voices()
+    prephonemize()
+    capture_cuda_graphs()
+    compile_decoder()
     show_menu()
 
     while True:
         try:
             choice = input("\nChoice: ").strip().lower()
-
-            if choice == 'q':
-                print("Goodbye!")
-                break
-            elif choice == 'p':
-                current_phrase_idx = (current_phrase_idx + 1) % len(TEST_PHRASES)
-                print(f"\nNew phrase: \"{TEST_PHRASES[current_phrase_idx]}\"")
-            elif choice == 'a':
-                print("\nPlaying all voices...")
-                for vid, grade, desc in VOICES:
-                    print(f"  {vid} ({grade})...", end=" ", flush=True)
-                    play_voice(vid, TEST_PHRASES[current_phrase_idx])
-                    print("done")
-            elif choice == 'af':
-                play_category('af_', 'American Female')
-            elif choice == 'bf':
-                play_category('bf_', 'British Female')
-            elif choice == 'am':
-                play_category('am_', 'American Male')
-            elif choice == 'bm':
-                play_category('bm_', 'British Male')
+            if choice in COMMANDS:
+                if COMMANDS[choice]() is False:
+                    break
             elif choice.isdigit():
-                idx = int(choice) - 1
-                if 0 <= idx < len(VOICES):
-                    vid, grade, desc = VOICES[idx]
-                    print(f"  Playing {vid}...", end=" ", flush=True)
-                    play_voice(vid, TEST_PHRASES[current_phrase_idx])
-                    print("done")
-                else:
-                    print(f"Invalid number (1-{len(VOICES)})")
-            elif choice == '':
-                show_menu()
+                _play_number(choice)
             else:
                 print("Unknown command. Press Enter to see menu.")
-        except KeyboardInterrupt:
+        except (KeyboardInterrupt, EOFError):
             print("\nGoodbye!")
             break
-        except Exception as e:
+        except PLAYBACK_ERRORS as e:
             print(f"Error: {e}")
 
 if __name__ == "__main__":